@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class SlotData:
     valgroup_id: str
     slot: int
@@ -14,7 +14,7 @@ class SlotData:
         return self.block_id_ext.split(":")[0] if self.block_id_ext else None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventData:
     valgroup_id: str
     slot: int
@@ -24,6 +24,10 @@ class EventData:
     validator: int | str | None = None
     t1_ms: float | None = None
 
+    @property
+    def duration_ms(self) -> float:
+        return self.t1_ms - self.t_ms if self.t1_ms else 0
+
     def get_color(self) -> str | None:
         from src.visualizer.style import COLOR_MAP
 
@@ -35,7 +39,7 @@ class EventData:
         return SYMBOL_MAP.get(self.kind, "circle")
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsensusData:
     slots: list[SlotData]
     events: list[EventData]
@@ -1,5 +1,13 @@
+import bisect
 import dataclasses
+import functools
+import itertools
+import math
+import operator
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import final, override
@@ -7,10 +15,8 @@ from typing import final, override
 from src.parser.parser_base import Parser
 from src.models import ConsensusData, SlotData, EventData
 
-type slot_id_type = tuple[str, int]
 
-
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VoteData:
     vote: str
     t_ms: float
@@ -28,18 +34,60 @@ TARGET_TO_LABEL = {
     "FinalObserved": "finalize_observed",
 }
 
+# (start mark, end mark, inferred label) for per-validator spans.
+_INFERRED_SPANS = (
+    ("collate_started", "collate_finished", "collation"),
+    ("validate_started", "validate_finished", "block_validation"),
+    ("notarize_observed", "finalize_observed", "finalization"),
+)
+
+_LINE_HEADER_RE = re.compile(
+    r"\[(?P<hour>\d{4}-\d{2}-\d{2} \d{2}):(?P<minute>\d{2}):(?P<second>\d{2})"
+    + r"\.(?P<microsecond>\d{6})\]"
+    + r".*?(?P<valgroup>valgroup\((?P<valgroup_name>[^)]+)\)\.(?P<valgroup_idx>\d+))"
+)
+_STATS_TARGET_RE = re.compile(r"target=(\w+),\s*slot=(\d+),\s*timestamp=([\d.]+)")
+_SLOT_RE = re.compile(r"slot=(\d+)")
+_VOTE_SLOT_RE = re.compile(r"id=\{(\d+)")
+_VOTE_RE = re.compile(r"vote=(\w+)")
+_START_SLOT_RE = re.compile(r"start_slot=(\d+)")
+_END_SLOT_RE = re.compile(r"end_slot=(\d+)")
+_FINALIZED_SLOT_RE = re.compile(r"candidate=Candidate\{id=\{(\d+)")
+_BLOCK_ID_RE = re.compile(r"(\([^)]+\):[A-F0-9]+:[A-F0-9]+)")
+_VALIDATOR_RE = re.compile(r"We are validator (\d+)")
+_WEIGHT_RE = re.compile(r"with weight (\d+)")
+_TOTAL_WEIGHT_RE = re.compile(r"out of (\d+)")
+
+
+@functools.lru_cache(maxsize=64)
+def _hour_start_s(hour: str) -> int:
+    return int(datetime.strptime(hour, "%Y-%m-%d %H").timestamp())
+
 
 @final
 class ParserLogs(Parser):
     def __init__(self, logs_path: list[Path]):
         self._logs_path = logs_path
-        self._slots: dict[slot_id_type, SlotData] = {}
-        self._collated: dict[slot_id_type, dict[str, EventData]] = {}
-        self._votes: dict[slot_id_type, dict[str, list[VoteData]]] = {}
+        self._slots: dict[str, dict[int, SlotData]] = {}
+        # Earliest StatsTargetReached time per slot, kept apart from the slot
+        # start so later files in a merge only lower it the way a sequential
+        # parse would.
+        self._stats_start_ms: dict[str, dict[int, float]] = {}
+        self._collated: dict[str, dict[int, dict[str, float]]] = {}
+        self._votes: dict[str, dict[int, dict[str, list[VoteData]]]] = {}
         self._total_weights: dict[str, int] = {}
-        self._slot_leaders: dict[slot_id_type, int] = {}
-        self._slot_events: dict[slot_id_type, dict[int, dict[str, EventData]]] = {}
+        # Leader per slot for each valgroup; a later window overwrites the
+        # slots it overlaps.
+        self._slot_leaders: dict[str, dict[int, int]] = {}
+        # (valgroup, start_slot, end_slot, v_id) in log order; merged into
+        # _slot_leaders by _merge.
+        self._leader_windows: list[tuple[str, int, int, int]] = []
+        # (valgroup, slot, v_id, t_ms, leader windows seen, event index) for
+        # FinalObserved lines, checked against the leaders by _merge.
+        self._final_observed: list[tuple[str, int, int, float, int, int]] = []
+        self._slot_events: dict[str, dict[int, dict[int, dict[str, float]]]] = {}
         self._events: list[EventData] = []
+        self._valgroup_cache: dict[str, str] = {}
 
     def _parse_stats_target_reached(
         self,
@@ -48,18 +96,17 @@ class ParserLogs(Parser):
         v_group: str,
         v_id: int,
     ):
-        stats_match = re.search(
-            r"target=(\w+),\s*slot=(\d+),\s*timestamp=([\d.]+)", line
-        )
+        stats_match = _STATS_TARGET_RE.search(line)
         if not stats_match:
             return
 
         target = stats_match.group(1)
         slot = int(stats_match.group(2))
-        slot_id = (v_group, slot)
+        group_slots = self._slots.setdefault(v_group, {})
 
-        if slot_id not in self._slots:
-            self._slots[slot_id] = SlotData(
+        slot_data = group_slots.get(slot)
+        if slot_data is None:
+            slot_data = SlotData(
                 valgroup_id=v_group,
                 slot=slot,
                 is_empty=False,
@@ -67,54 +114,61 @@ class ParserLogs(Parser):
                 block_id_ext=None,
                 collator=None,
             )
+            group_slots[slot] = slot_data
+        elif t_ms < slot_data.slot_start_est_ms:
+            slot_data.slot_start_est_ms = t_ms
 
-        self._slots[slot_id].slot_start_est_ms = min(
-            t_ms, self._slots[slot_id].slot_start_est_ms
-        )
+        group_stats_start = self._stats_start_ms.setdefault(v_group, {})
+        if t_ms < group_stats_start.get(slot, math.inf):
+            group_stats_start[slot] = t_ms
 
         if target == "CollateStarted":
-            self._slots[slot_id].collator = v_id
-
-        if (
-            target == "FinalObserved"
-            and self._slot_leaders.get((v_group, slot + 1)) == v_id
-        ):
-            self._events.append(
-                EventData(
-                    valgroup_id=v_group,
-                    slot=slot,
-                    label="finalize_observed_by_next_leader",
-                    kind="observed",
-                    t_ms=t_ms,
-                    t1_ms=None,
+            slot_data.collator = v_id
+
+        if target == "FinalObserved":
+            # The next leader may be announced in an earlier file, so the
+            # check waits until this file is merged.
+            self._final_observed.append(
+                (
+                    v_group,
+                    slot,
+                    v_id,
+                    t_ms,
+                    len(self._leader_windows),
+                    len(self._events),
                 )
             )
 
         if target in TARGET_TO_LABEL:
             label = TARGET_TO_LABEL[target]
-            ev = EventData(
-                valgroup_id=v_group,
-                slot=slot,
-                label=label,
-                kind="local",
-                t_ms=t_ms,
-                validator=v_id,
-                t1_ms=None,
-            )
-            self._slot_events.setdefault(slot_id, {}).setdefault(v_id, {})[label] = ev
+            self._slot_events.setdefault(v_group, {}).setdefault(slot, {}).setdefault(
+                v_id, {}
+            )[label] = t_ms
 
             if label == "candidate_received":
-                self._events.append(ev)
+                self._events.append(
+                    EventData(
+                        valgroup_id=v_group,
+                        slot=slot,
+                        label=label,
+                        kind="local",
+                        t_ms=t_ms,
+                        validator=v_id,
+                        t1_ms=None,
+                    )
+                )
 
             if label in ("collate_started", "collate_finished"):
-                self._collated.setdefault(slot_id, {})[label] = ev
+                self._collated.setdefault(v_group, {}).setdefault(slot, {})[label] = (
+                    t_ms
+                )
 
     def _parse_skip_vote(self, line: str, t_ms: float, v_group: str, v_id: int):
-        slot_match = re.search(r"slot=(\d+)", line)
+        slot_match = _SLOT_RE.search(line)
         assert slot_match is not None
 
         slot = int(slot_match.group(1))
-        slot_id = (v_group, slot)
+        group_slots = self._slots.setdefault(v_group, {})
 
         self._events.append(
             EventData(
@@ -127,8 +181,8 @@ class ParserLogs(Parser):
             )
         )
 
-        if slot_id not in self._slots:
-            self._slots[slot_id] = SlotData(
+        if slot not in group_slots:
+            group_slots[slot] = SlotData(
                 valgroup_id=v_group,
                 slot=slot,
                 is_empty=True,
@@ -137,131 +191,148 @@ class ParserLogs(Parser):
                 collator=None,
             )
         else:
-            self._slots[slot_id].is_empty = True
+            group_slots[slot].is_empty = True
 
     def _parse_publish_event(
         self, line: str, t_ms: float, v_group: str, v_id: int, v_weights: dict[str, int]
     ):
         if "BroadcastVote" in line and "SkipVote" not in line:
-            slot_match = re.search(r"id=\{(\d+)", line)
+            slot_match = _VOTE_SLOT_RE.search(line)
             assert slot_match is not None
             slot = int(slot_match.group(1))
-            slot_id = (v_group, slot)
 
-            vote_match = re.search(r"vote=(\w+)", line)
+            vote_match = _VOTE_RE.search(line)
             assert vote_match is not None
-            vote = vote_match.group(1)
+            vote = sys.intern(vote_match.group(1))
 
-            self._votes.setdefault(slot_id, {}).setdefault(vote, []).append(
+            self._votes.setdefault(v_group, {}).setdefault(slot, {}).setdefault(
+                vote, []
+            ).append(
                 VoteData(vote=vote, t_ms=t_ms, v_id=v_id, weight=v_weights[v_group])
             )
 
         elif "OurLeaderWindowStarted" in line:
-            start_slot_match = re.search(r"start_slot=(\d+)", line)
+            start_slot_match = _START_SLOT_RE.search(line)
             assert start_slot_match is not None
             start_slot = int(start_slot_match.group(1))
 
-            end_slot_match = re.search(r"end_slot=(\d+)", line)
+            end_slot_match = _END_SLOT_RE.search(line)
             assert end_slot_match is not None
             end_slot = int(end_slot_match.group(1))
 
-            for s in range(start_slot, end_slot):
-                self._slot_leaders[(v_group, s)] = v_id
+            self._leader_windows.append((v_group, start_slot, end_slot, v_id))
         elif "BlockFinalized" in line and not "BlockFinalizedInMasterchain" in line:
-            slot_match = re.search(r"candidate=Candidate\{id=\{(\d+)", line)
+            slot_match = _FINALIZED_SLOT_RE.search(line)
             assert slot_match is not None
             slot = int(slot_match.group(1))
-            slot_id = (v_group, slot)
-            block_id_match = re.search(r"(\([^)]+\):[A-F0-9]+:[A-F0-9]+)", line)
+            group_slots = self._slots.setdefault(v_group, {})
+            block_id_match = _BLOCK_ID_RE.search(line)
             assert block_id_match is not None
             block_id = block_id_match.group(0)
-            self._slots[slot_id].block_id_ext = block_id
+            if slot not in group_slots:
+                # Files are parsed independently, so the slot may only have been
+                # seen in another validator's log so far.
+                group_slots[slot] = SlotData(
+                    valgroup_id=v_group,
+                    slot=slot,
+                    is_empty=False,
+                    slot_start_est_ms=t_ms,
+                    block_id_ext=None,
+                    collator=None,
+                )
+            group_slots[slot].block_id_ext = block_id
+
+    def _add_leader_window(
+        self, v_group: str, start_slot: int, end_slot: int, v_id: int
+    ) -> None:
+        self._slot_leaders.setdefault(v_group, {}).update(
+            dict.fromkeys(range(start_slot, end_slot), v_id)
+        )
 
     def _infer_slot_events(self) -> None:
-        for s in self._slot_events.values():
-            for events in s.values():
-                for start_event_name, end_event_name, label in (
-                    ("collate_started", "collate_finished", "collation"),
-                    ("validate_started", "validate_finished", "block_validation"),
-                    ("notarize_observed", "finalize_observed", "finalization"),
-                ):
-                    if start_event_name not in events or end_event_name not in events:
-                        continue
-                    e = events[start_event_name]
-                    end_event = events[end_event_name]
-                    self._events.append(
-                        EventData(
-                            valgroup_id=e.valgroup_id,
-                            slot=e.slot,
-                            validator=e.validator,
-                            label=label,
-                            kind=e.kind,
-                            t_ms=e.t_ms,
-                            t1_ms=end_event.t_ms,
+        inferred: list[EventData] = []
+        append = inferred.append
+        event_cls = EventData
+
+        for v_group, group_slot_events in self._slot_events.items():
+            for slot, validators in group_slot_events.items():
+                for v_id, times in validators.items():
+                    for start_event_name, end_event_name, label in _INFERRED_SPANS:
+                        t_start = times.get(start_event_name)
+                        if t_start is None:
+                            continue
+                        t_end = times.get(end_event_name)
+                        if t_end is None:
+                            continue
+                        append(
+                            event_cls(
+                                valgroup_id=v_group,
+                                slot=slot,
+                                validator=v_id,
+                                label=label,
+                                kind="local",
+                                t_ms=t_start,
+                                t1_ms=t_end,
+                            )
                         )
-                    )
+
+        self._events.extend(inferred)
 
     def _infer_slot_phases(self):
-        for slot_id, slot_data in self._slots.items():
-            self._events.append(
-                EventData(
-                    valgroup_id=slot_data.valgroup_id,
-                    slot=slot_data.slot,
-                    label="slot_start_est",
-                    kind="estimate",
-                    t_ms=slot_data.slot_start_est_ms,
-                )
-            )
+        for v_group, group_slots in self._slots.items():
+            group_collated = self._collated.get(v_group, {})
+            group_votes = self._votes.get(v_group, {})
+
+            total_weight = self._total_weights[v_group]
+            weight_threshold = (total_weight * 2) // 3 + 1
 
-            collate_start = None
-            collate_end = None
-            if (
-                slot_id in self._collated
-                and "collate_started" in self._collated[slot_id]
-                and "collate_finished" in self._collated[slot_id]
-            ):
-                collate_start = self._collated[slot_id]["collate_started"].t_ms
-                collate_end = self._collated[slot_id]["collate_finished"].t_ms
+            for slot, slot_data in group_slots.items():
                 self._events.append(
                     EventData(
                         valgroup_id=slot_data.valgroup_id,
                         slot=slot_data.slot,
-                        label="collate",
-                        kind="phase",
-                        t_ms=collate_start,
-                        t1_ms=collate_end,
+                        label="slot_start_est",
+                        kind="estimate",
+                        t_ms=slot_data.slot_start_est_ms,
                     )
                 )
 
-            total_weight = self._total_weights[slot_id[0]]
-            weight_threshold = (total_weight * 2) // 3 + 1
+                collated = group_collated.get(slot, {})
+                collate_start = None
+                collate_end = None
+                if "collate_started" in collated and "collate_finished" in collated:
+                    collate_start = collated["collate_started"]
+                    collate_end = collated["collate_finished"]
+                    self._events.append(
+                        EventData(
+                            valgroup_id=slot_data.valgroup_id,
+                            slot=slot_data.slot,
+                            label="collate",
+                            kind="phase",
+                            t_ms=collate_start,
+                            t1_ms=collate_end,
+                        )
+                    )
 
-            notarize_reached = None
-            if (
-                slot_id in self._votes
-                and "NotarizeVote" in self._votes[slot_id]
-                and collate_end is not None
-            ):
-                notarize_reached = self._process_vote_threshold(
-                    slot_data=slot_data,
-                    votes=self._votes[slot_id]["NotarizeVote"],
-                    weight_threshold=weight_threshold,
-                    label="notarize",
-                    phase_start=collate_end,
-                )
+                votes = group_votes.get(slot, {})
+                notarize_reached = None
+                if "NotarizeVote" in votes and collate_end is not None:
+                    notarize_reached = self._process_vote_threshold(
+                        slot_data=slot_data,
+                        votes=votes["NotarizeVote"],
+                        weight_threshold=weight_threshold,
+                        label="notarize",
+                        phase_start=collate_end,
+                    )
 
-            if (
-                slot_id in self._votes
-                and "FinalizeVote" in self._votes[slot_id]
-                and notarize_reached is not None
-            ):
-                _ = self._process_vote_threshold(
-                    slot_data=slot_data,
-                    votes=self._votes[slot_id]["FinalizeVote"],
-                    weight_threshold=weight_threshold,
-                    label="finalize",
-                    phase_start=notarize_reached,
-                )
+                if "FinalizeVote" in votes and notarize_reached is not None:
+                    _ = self._process_vote_threshold(
+                        slot_data=slot_data,
+                        votes=votes["FinalizeVote"],
+                        weight_threshold=weight_threshold,
+                        label="finalize",
+                        phase_start=notarize_reached,
+                    )
 
     def _process_vote_threshold(
         self,
@@ -271,54 +342,53 @@ class ParserLogs(Parser):
         label: str,
         phase_start: float,
     ) -> float | None:
-        current_weight = 0
-        sorted_votes = sorted(votes, key=lambda x: x.t_ms)
-
-        for vote in sorted_votes:
-            current_weight += vote.weight
-            if current_weight >= weight_threshold:
-                self._events.append(
-                    EventData(
-                        valgroup_id=slot_data.valgroup_id,
-                        slot=slot_data.slot,
-                        label=f"{label}_reached",
-                        kind="reached",
-                        t_ms=vote.t_ms,
-                        validator=None,
-                        t1_ms=None,
-                    )
-                )
-                self._events.append(
-                    EventData(
-                        valgroup_id=slot_data.valgroup_id,
-                        slot=slot_data.slot,
-                        label=label,
-                        kind="phase",
-                        t_ms=phase_start,
-                        t1_ms=vote.t_ms,
-                    )
-                )
-                return vote.t_ms
-
-        return None
+        sorted_votes = sorted(votes, key=operator.attrgetter("t_ms"))
+        cumulative_weights = list(itertools.accumulate(v.weight for v in sorted_votes))
+        reached_idx = bisect.bisect_left(cumulative_weights, weight_threshold)
+        if reached_idx == len(sorted_votes):
+            return None
 
-    @staticmethod
-    def _extract_timestamp(line: str) -> float | None:
-        timestamp_match = re.search(
-            r"\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{6})\]", line
+        reached_t_ms = sorted_votes[reached_idx].t_ms
+        self._events.append(
+            EventData(
+                valgroup_id=slot_data.valgroup_id,
+                slot=slot_data.slot,
+                label=f"{label}_reached",
+                kind="reached",
+                t_ms=reached_t_ms,
+                validator=None,
+                t1_ms=None,
+            )
         )
-        if not timestamp_match:
-            return None
-        timestamp_str = timestamp_match.group(1)
-        dt = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
-        return dt.timestamp() * 1000
+        self._events.append(
+            EventData(
+                valgroup_id=slot_data.valgroup_id,
+                slot=slot_data.slot,
+                label=label,
+                kind="phase",
+                t_ms=phase_start,
+                t1_ms=reached_t_ms,
+            )
+        )
+        return reached_t_ms
 
     @staticmethod
-    def _extract_valgroup(line: str) -> str | None:
-        valgroup_match = re.search(r"valgroup\(([^)]+)\)\.(\d+)", line)
-        if not valgroup_match:
-            return None
-        v_group = f"{valgroup_match.group(1)}.{valgroup_match.group(2)}"
+    def _extract_timestamp(header_match: re.Match[str]) -> float:
+        seconds = (
+            _hour_start_s(header_match.group("hour"))
+            + int(header_match.group("minute")) * 60
+            + int(header_match.group("second"))
+        )
+        return (seconds + int(header_match.group("microsecond")) / 1e6) * 1000
+
+    def _extract_valgroup(self, header_match: re.Match[str]) -> str:
+        raw = header_match.group("valgroup")
+        v_group = self._valgroup_cache.get(raw)
+        if v_group is None:
+            name = header_match.group("valgroup_name")
+            idx = header_match.group("valgroup_idx")
+            v_group = sys.intern(f"{name}.{idx}")
+            self._valgroup_cache[raw] = v_group
         return v_group
 
     def _parse_validator_info(
@@ -331,15 +401,15 @@ class ParserLogs(Parser):
         if "We are validator" not in line:
             return
 
-        validator_match = re.search(r"We are validator (\d+)", line)
+        validator_match = _VALIDATOR_RE.search(line)
         assert validator_match is not None
         v_groups[v_group] = int(validator_match.group(1))
 
-        weight_match = re.search(r"with weight (\d+)", line)
+        weight_match = _WEIGHT_RE.search(line)
         assert weight_match is not None
         v_weights[v_group] = int(weight_match.group(1))
 
-        total_weight_match = re.search(r"out of (\d+)", line)
+        total_weight_match = _TOTAL_WEIGHT_RE.search(line)
         assert total_weight_match is not None
         self._total_weights[v_group] = int(total_weight_match.group(1))
 
@@ -362,28 +432,130 @@ class ParserLogs(Parser):
         elif "Published event" in line:
             self._parse_publish_event(line, t_ms, v_group, v_id, v_weights)
 
-    @override
-    def parse(self) -> ConsensusData:
-        for log_file in self._logs_path:
-            data = log_file.read_text().splitlines()
+    def _parse_file(self, log_file: Path) -> None:
+        v_groups: dict[str, int] = {}
+        v_weights: dict[str, int] = {}
 
-            v_groups: dict[str, int] = {}
-            v_weights: dict[str, int] = {}
+        search_header = _LINE_HEADER_RE.search
+        extract_timestamp = self._extract_timestamp
+        extract_valgroup = self._extract_valgroup
+        parse_validator_info = self._parse_validator_info
+        process_log_line = self._process_log_line
 
-            for line in data:
-                t_ms = self._extract_timestamp(line)
-                if t_ms is None:
+        with log_file.open("r", encoding="utf-8", buffering=1 << 20) as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+            for line in f:
+                if "valgroup(" not in line:
                     continue
 
-                v_group = self._extract_valgroup(line)
-                if v_group is None:
+                header_match = search_header(line)
+                if header_match is None:
                     continue
 
-                self._parse_validator_info(line, v_group, v_groups, v_weights)
+                t_ms = extract_timestamp(header_match)
+                v_group = extract_valgroup(header_match)
+
+                parse_validator_info(line, v_group, v_groups, v_weights)
+
+                process_log_line(line, v_group, t_ms, v_groups, v_weights)
+
+    @staticmethod
+    def _parse_single_file(log_file: Path) -> "ParserLogs":
+        parser = ParserLogs([log_file])
+        parser._parse_file(log_file)
+        return parser
+
+    def _merge(self, other: "ParserLogs") -> None:
+        for v_group, other_slots in other._slots.items():
+            group_slots = self._slots.setdefault(v_group, {})
+            for slot, other_slot in other_slots.items():
+                slot_data = group_slots.get(slot)
+                if slot_data is None:
+                    group_slots[slot] = other_slot
+                    continue
+                stats_start = other._stats_start_ms.get(v_group, {}).get(slot)
+                if (
+                    stats_start is not None
+                    and stats_start < slot_data.slot_start_est_ms
+                ):
+                    slot_data.slot_start_est_ms = stats_start
+                slot_data.is_empty = slot_data.is_empty or other_slot.is_empty
+                if other_slot.collator is not None:
+                    slot_data.collator = other_slot.collator
+                if other_slot.block_id_ext is not None:
+                    slot_data.block_id_ext = other_slot.block_id_ext
+
+        for v_group, other_collated in other._collated.items():
+            group_collated = self._collated.setdefault(v_group, {})
+            for slot, collated in other_collated.items():
+                group_collated.setdefault(slot, {}).update(collated)
+
+        for v_group, other_votes in other._votes.items():
+            group_votes = self._votes.setdefault(v_group, {})
+            for slot, votes in other_votes.items():
+                slot_votes = group_votes.setdefault(slot, {})
+                for vote, vote_list in votes.items():
+                    slot_votes.setdefault(vote, []).extend(vote_list)
+
+        for v_group, other_slot_events in other._slot_events.items():
+            group_slot_events = self._slot_events.setdefault(v_group, {})
+            for slot, validators in other_slot_events.items():
+                slot_events = group_slot_events.setdefault(slot, {})
+                for v_id, times in validators.items():
+                    slot_events.setdefault(v_id, {}).update(times)
+
+        self._total_weights.update(other._total_weights)
+
+        # Replay the leader windows and FinalObserved lines in log order so a
+        # window is only visible to lines after it, as in a sequential parse.
+        windows = other._leader_windows
+        events = other._events
+        windows_added = 0
+        events_added = 0
+        for v_group, slot, v_id, t_ms, windows_seen, event_idx in other._final_observed:
+            for win_group, start_slot, end_slot, win_v_id in windows[
+                windows_added:windows_seen
+            ]:
+                self._add_leader_window(win_group, start_slot, end_slot, win_v_id)
+            windows_added = windows_seen
+
+            if self._slot_leaders.get(v_group, {}).get(slot + 1) != v_id:
+                continue
+            self._events.extend(events[events_added:event_idx])
+            events_added = event_idx
+            self._events.append(
+                EventData(
+                    valgroup_id=v_group,
+                    slot=slot,
+                    label="finalize_observed_by_next_leader",
+                    kind="observed",
+                    t_ms=t_ms,
+                    t1_ms=None,
+                )
+            )
+
+        for win_group, start_slot, end_slot, win_v_id in windows[windows_added:]:
+            self._add_leader_window(win_group, start_slot, end_slot, win_v_id)
+        self._events.extend(events[events_added:])
 
-                self._process_log_line(line, v_group, t_ms, v_groups, v_weights)
+    @override
+    def parse(self) -> ConsensusData:
+        if len(self._logs_path) > 1:
+            with ProcessPoolExecutor() as executor:
+                for file_parser in executor.map(
+                    ParserLogs._parse_single_file, self._logs_path
+                ):
+                    self._merge(file_parser)
+        else:
+            for log_file in self._logs_path:
+                self._merge(self._parse_single_file(log_file))
 
         self._infer_slot_phases()
         self._infer_slot_events()
 
-        return ConsensusData(slots=list(self._slots.values()), events=self._events)
+        slots = [
+            s for group_slots in self._slots.values() for s in group_slots.values()
+        ]
+        return ConsensusData(slots=slots, events=self._events)
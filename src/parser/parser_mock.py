@@ -1,5 +1,5 @@
 import random
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import final, override
 
 from src.parser.parser_base import Parser
@@ -33,35 +33,35 @@ class ParserMock(Parser):
         slots: list[SlotData] = []
         events: list[EventData] = []
 
+        start_ms = self._to_ms(self.start_utc)
+        # Per-validator base lags don't depend on the group or slot.
+        validator_lags = [
+            (10 + (i % 5) * 7, 20 + (i % 4) * 9, 30 + (i % 6) * 8)
+            for i in range(self.n_validators)
+        ]
+
         for group_idx in range(self.n_groups):
             group_id = "mc" if group_idx == 0 else f"shard:{group_idx}"
             validators = [f"{group_id}:v{i:02d}" for i in range(self.n_validators)]
-            group_start = self.start_utc + timedelta(seconds=5 * group_idx)
+            group_start_ms = start_ms + 5000 * group_idx
 
             for slot_idx in range(self.n_slots):
                 is_empty = slot_idx % self.empty_every == 0
 
                 jitter = ((slot_idx * 37 + group_idx * 13) % 51) - 25
-                slot_start = group_start + timedelta(
-                    milliseconds=slot_idx * self.collate_gap_ms + jitter
-                )
-
-                collate_start = group_start + timedelta(
-                    milliseconds=slot_idx * self.collate_gap_ms
-                )
-                collate_end = collate_start + timedelta(milliseconds=self.phase_ms)
-                notarize_time = collate_end + timedelta(milliseconds=self.phase_ms)
-                finalize_time = notarize_time + timedelta(milliseconds=self.phase_ms)
-                finalize_observed = collate_start + timedelta(
-                    milliseconds=self.finalize_lag_ms
-                )
+                collate_start = group_start_ms + slot_idx * self.collate_gap_ms
+                slot_start = collate_start + jitter
+                collate_end = collate_start + self.phase_ms
+                notarize_time = collate_end + self.phase_ms
+                finalize_time = notarize_time + self.phase_ms
+                finalize_observed = collate_start + self.finalize_lag_ms
 
                 slots.append(
                     SlotData(
                         valgroup_id=group_id,
                         slot=slot_idx,
                         is_empty=is_empty,
-                        slot_start_est_ms=self._to_ms(slot_start),
+                        slot_start_est_ms=slot_start,
                         block_id_ext=None
                         if is_empty
                         else f"{group_id}-B{slot_idx:06d}",
@@ -77,7 +77,7 @@ class ParserMock(Parser):
                         slot=slot_idx,
                         label="slot_start_est",
                         kind="estimate",
-                        t_ms=self._to_ms(slot_start),
+                        t_ms=slot_start,
                         validator=None,
                         t1_ms=None,
                     )
@@ -97,6 +97,7 @@ class ParserMock(Parser):
                         notarize_time,
                         finalize_time,
                         finalize_observed,
+                        validator_lags,
                         events,
                     )
         return ConsensusData(slots=slots, events=events)
@@ -106,11 +107,11 @@ class ParserMock(Parser):
         group_id: str,
         slot: int,
         validators: list[str],
-        collate_start: datetime,
+        collate_start: int,
         events: list[EventData],
     ) -> None:
-        skip_time = collate_start + timedelta(milliseconds=self.phase_ms * 2)
-        finalize_obs = skip_time + timedelta(milliseconds=self.phase_ms)
+        skip_time = collate_start + self.phase_ms * 2
+        finalize_obs = skip_time + self.phase_ms
 
         events.extend(
             [
@@ -119,7 +120,7 @@ class ParserMock(Parser):
                     slot=slot,
                     label="skip_reached",
                     kind="reached",
-                    t_ms=self._to_ms(skip_time),
+                    t_ms=skip_time,
                     validator=None,
                     t1_ms=None,
                 ),
@@ -128,7 +129,7 @@ class ParserMock(Parser):
                     slot=slot,
                     label="finalize_observed_by_next_leader",
                     kind="observed",
-                    t_ms=self._to_ms(finalize_obs),
+                    t_ms=finalize_obs,
                     validator=None,
                     t1_ms=None,
                 ),
@@ -144,8 +145,8 @@ class ParserMock(Parser):
                     validator=validator,
                     label="skip_observed",
                     kind="observed",
-                    t_ms=self._to_ms(skip_time) + lag,
-                    t1_ms=self._to_ms(skip_time) + lag,
+                    t_ms=skip_time + lag,
+                    t1_ms=skip_time + lag,
                 )
             )
 
@@ -154,11 +155,12 @@ class ParserMock(Parser):
         group_id: str,
         slot: int,
         validators: list[str],
-        collate_start: datetime,
-        collate_end: datetime,
-        notarize_time: datetime,
-        finalize_time: datetime,
-        finalize_observed: datetime,
+        collate_start: int,
+        collate_end: int,
+        notarize_time: int,
+        finalize_time: int,
+        finalize_observed: int,
+        validator_lags: list[tuple[int, int, int]],
         events: list[EventData],
     ) -> None:
         collator = validators[slot % self.n_validators]
@@ -170,27 +172,27 @@ class ParserMock(Parser):
                     slot=slot,
                     label="collate",
                     kind="phase",
-                    t_ms=self._to_ms(collate_start),
+                    t_ms=collate_start,
                     validator=None,
-                    t1_ms=self._to_ms(collate_end),
+                    t1_ms=collate_end,
                 ),
                 EventData(
                     valgroup_id=group_id,
                     slot=slot,
                     label="notarize",
                     kind="phase",
-                    t_ms=self._to_ms(collate_end),
+                    t_ms=collate_end,
                     validator=None,
-                    t1_ms=self._to_ms(notarize_time),
+                    t1_ms=notarize_time,
                 ),
                 EventData(
                     valgroup_id=group_id,
                     slot=slot,
                     label="finalize",
                     kind="phase",
-                    t_ms=self._to_ms(notarize_time),
+                    t_ms=notarize_time,
                     validator=None,
-                    t1_ms=self._to_ms(finalize_time),
+                    t1_ms=finalize_time,
                 ),
             ]
         )
@@ -202,7 +204,7 @@ class ParserMock(Parser):
                     slot=slot,
                     label="notarize_reached",
                     kind="reached",
-                    t_ms=self._to_ms(notarize_time),
+                    t_ms=notarize_time,
                     validator=None,
                     t1_ms=None,
                 ),
@@ -211,7 +213,7 @@ class ParserMock(Parser):
                     slot=slot,
                     label="finalize_reached",
                     kind="reached",
-                    t_ms=self._to_ms(finalize_time),
+                    t_ms=finalize_time,
                     validator=None,
                     t1_ms=None,
                 ),
@@ -220,24 +222,20 @@ class ParserMock(Parser):
                     slot=slot,
                     label="finalize_observed_by_next_leader",
                     kind="observed",
-                    t_ms=self._to_ms(finalize_observed),
+                    t_ms=finalize_observed,
                     validator=None,
                     t1_ms=None,
                 ),
             ]
         )
 
-        for i, validator in enumerate(validators):
-            receive_time = (
-                self._to_ms(collate_end) + 10 + (i % 5) * 7 + (slot * 11 + i * 3) % 20
-            )
+        for i, (validator, (receive_lag, notarize_lag, finalize_lag)) in enumerate(
+            zip(validators, validator_lags)
+        ):
+            receive_time = collate_end + receive_lag + (slot * 11 + i * 3) % 20
             validate_time = receive_time + 15 + (i * 5 + slot) % 25
-            notarize_obs = (
-                self._to_ms(notarize_time) + 20 + (i % 4) * 9 + (slot * 7 + i * 13) % 60
-            )
-            finalize_obs = (
-                self._to_ms(finalize_time) + 30 + (i % 6) * 8 + (slot * 5 + i * 17) % 80
-            )
+            notarize_obs = notarize_time + notarize_lag + (slot * 7 + i * 13) % 60
+            finalize_obs = finalize_time + finalize_lag + (slot * 5 + i * 17) % 80
 
             if validator == collator:
                 events.extend(
@@ -248,7 +246,7 @@ class ParserMock(Parser):
                             validator=validator,
                             label="collate_started",
                             kind="local",
-                            t_ms=self._to_ms(collate_start),
+                            t_ms=collate_start,
                             t1_ms=None,
                         ),
                         EventData(
@@ -257,7 +255,7 @@ class ParserMock(Parser):
                             validator=validator,
                             label="collate_finished",
                             kind="local",
-                            t_ms=self._to_ms(collate_end),
+                            t_ms=collate_end,
                             t1_ms=None,
                         ),
                     ]
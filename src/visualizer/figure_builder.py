@@ -1,11 +1,34 @@
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from typing import final
 
 import plotly.graph_objects as go  # pyright: ignore[reportMissingTypeStubs]
 
 from src.models import ConsensusData, EventData, SlotData
 
-
+# Traces are built as plain dicts and handed to go.Figure(_validate=False):
+# constructing go.Bar/go.Scatter and add_trace validate and deep-copy every
+# array, which dominated figure build time.
+type Trace = dict[str, object]
+
+# Validator event labels drawn on the detail figure, in trace order; the
+# point-like ones are markers, the rest are bars.
+DETAIL_EVENT_ORDER = (
+    "block_validation",
+    "candidate_received",
+    "collation",
+    "finalization",
+    "skip_observed",
+)
+DETAIL_EVENT_LABELS = frozenset(DETAIL_EVENT_ORDER)
+DETAIL_MARKER_LABELS = frozenset({"skip_observed", "candidate_received"})
+
+
+# Every summary/detail rebuild converts the same event timestamps again;
+# datetimes are immutable, so the converted values can be shared.
+@lru_cache(maxsize=1 << 16)
 def to_datetime(t_ms: float) -> datetime:
     return datetime.fromtimestamp(t_ms / 1000, tz=timezone.utc)
 
@@ -14,19 +37,64 @@ def to_relative(t_ms: float, base_ms: float) -> float:
     return round(t_ms - base_ms, 6)
 
 
+def _h_bar(
+    label: str,
+    y: Sequence[object],
+    base: Sequence[object],
+    x: list[float],
+    color: str | None,
+    customdata: list[tuple[object, ...]],
+    hovertemplate: str,
+    legendgroup: str | None = None,
+) -> Trace:
+    trace: Trace = {
+        "type": "bar",
+        "orientation": "h",
+        "y": y,
+        "base": base,
+        "x": x,
+        "name": label,
+        "marker": {"color": color},
+        "customdata": customdata,
+        "hovertemplate": hovertemplate,
+    }
+    if legendgroup is not None:
+        trace["legendgroup"] = legendgroup
+    return trace
+
+
 class DataFilter:
     def __init__(self, data: ConsensusData):
         self._data: ConsensusData = data
 
+    @cached_property
+    def _slot_index(self) -> dict[tuple[str, int], SlotData]:
+        index: dict[tuple[str, int], SlotData] = {}
+        for s in self._data.slots:
+            _ = index.setdefault((s.valgroup_id, s.slot), s)
+        return index
+
+    @cached_property
+    def _slots_by_valgroup(self) -> dict[str, list[SlotData]]:
+        index: dict[str, list[SlotData]] = {}
+        for s in self._data.slots:
+            index.setdefault(s.valgroup_id, []).append(s)
+        return index
+
+    @cached_property
+    def _events_by_slot(self) -> dict[tuple[str, int], list[EventData]]:
+        index: dict[tuple[str, int], list[EventData]] = {}
+        for e in self._data.events:
+            index.setdefault((e.valgroup_id, e.slot), []).append(e)
+        return index
+
     def filter_slots(
         self, valgroup_id: str, slot_from: int, slot_to: int, show_empty: bool
     ) -> list[SlotData]:
         return [
             s
-            for s in self._data.slots
-            if s.valgroup_id == valgroup_id
-            and slot_from <= s.slot <= slot_to
-            and (show_empty or not s.is_empty)
+            for s in self._slots_by_valgroup.get(valgroup_id, ())
+            if slot_from <= s.slot <= slot_to and (show_empty or not s.is_empty)
         ]
 
     def filter_events(
@@ -38,37 +106,54 @@ class DataFilter:
         kinds: set[str] | None = None,
         has_validator: bool | None = None,
     ) -> list[EventData]:
-        result: list[EventData] = []
-        for e in self._data.events:
-            if valgroup_id and e.valgroup_id != valgroup_id:
-                continue
-            if slot is not None and e.slot != slot:
-                continue
-            if slots and e.slot not in slots:
-                continue
-            if labels and e.label not in labels:
-                continue
-            if kinds and e.kind not in kinds:
-                continue
-            if has_validator is not None:
-                if has_validator and e.validator is None:
-                    continue
-                if not has_validator and e.validator is not None:
-                    continue
-            result.append(e)
+        # An empty set matches nothing; don't treat it as "no filter".
+        if (
+            (slots is not None and not slots)
+            or (labels is not None and not labels)
+            or (kinds is not None and not kinds)
+        ):
+            return []
+
+        # Both figures ask for one valgroup and a known set of slots, so
+        # start from the per-slot index instead of scanning every event, then
+        # run one pass per filter that is actually set.
+        result: list[EventData]
+        if valgroup_id and slot is not None:
+            if slots and slot not in slots:
+                return []
+            result = list(self._events_by_slot.get((valgroup_id, slot), ()))
+        elif valgroup_id and slots:
+            by_slot = self._events_by_slot
+            result = [
+                e for s in sorted(slots) for e in by_slot.get((valgroup_id, s), ())
+            ]
+        else:
+            result = (
+                [e for e in self._data.events if e.valgroup_id == valgroup_id]
+                if valgroup_id
+                else list(self._data.events)
+            )
+            if slot is not None:
+                result = [e for e in result if e.slot == slot]
+            if slots:
+                result = [e for e in result if e.slot in slots]
+
+        if labels:
+            result = [e for e in result if e.label in labels]
+        if kinds:
+            result = [e for e in result if e.kind in kinds]
+        if has_validator is not None:
+            result = [e for e in result if (e.validator is not None) == has_validator]
         return result
 
     def get_slot(self, valgroup_id: str, slot: int) -> SlotData | None:
-        for s in self._data.slots:
-            if s.valgroup_id == valgroup_id and s.slot == slot:
-                return s
-        return None
+        return self._slot_index.get((valgroup_id, slot))
 
     @staticmethod
     def group_events_by_label(events: list[EventData]) -> dict[str, list[EventData]]:
-        result: dict[str, list[EventData]] = {}
+        result: defaultdict[str, list[EventData]] = defaultdict(list)
         for e in events:
-            result.setdefault(e.label, []).append(e)
+            result[e.label].append(e)
         return result
 
 
@@ -76,8 +161,12 @@ class DataFilter:
 class SummaryFigureBuilder:
     def __init__(self, valgroup_id: str, slot_dict: dict[int, SlotData]):
         self._valgroup_id: str = valgroup_id
-        self._fig = go.Figure()
-        self._slot_dict = slot_dict
+        self._traces: list[Trace] = []
+        # y-axis label and block id per slot, computed once and shared by
+        # every trace instead of str()/block_id() per event.
+        self._slot_keys: dict[int, tuple[str, str | None]] = {
+            n: (str(n), s.block_id()) for n, s in slot_dict.items()
+        }
 
     def build(
         self,
@@ -88,69 +177,86 @@ class SummaryFigureBuilder:
     ) -> go.Figure:
         self._add_bars(segments)
         self._add_markers(markers)
-        self._configure_layout(slot_from, slot_to)
-        return self._fig
+        fig = go.Figure(data=self._traces, _validate=False)
+        self._configure_layout(fig, slot_from, slot_to)
+        return fig
 
     def _add_bars(self, segments: list[EventData]) -> None:
         events_by_label = DataFilter.group_events_by_label(segments)
+        slot_keys = self._slot_keys
 
-        for label in sorted(events_by_label.keys()):
+        for label in sorted(events_by_label):
             events = events_by_label[label]
-            _ = self._fig.add_trace(  # pyright: ignore[reportUnknownMemberType]
-                go.Bar(
-                    orientation="h",
-                    y=[str(e.slot) for e in events],
-                    base=[to_datetime(e.t_ms) for e in events],
-                    x=[e.t1_ms - e.t_ms if e.t1_ms else 0 for e in events],
-                    name=label,
-                    marker=dict(color=events[0].get_color()),
-                    customdata=[
-                        [
-                            self._valgroup_id,
-                            e.slot,
-                            e.t1_ms - e.t_ms if e.t1_ms else 0,
-                            self._slot_dict[e.slot].block_id(),
-                        ]
-                        for e in events
-                    ],
-                    hovertemplate=f"valgroup={self._valgroup_id}<br>slot=%{{customdata[1]}}<br>segment={label}<br>start=%{{base|%H:%M:%S.%f}}<br>dt=%{{customdata[2]:.3f}}ms<br>block_id=%{{customdata[3]}}<extra></extra>",
+            y: list[str] = []
+            base: list[datetime] = []
+            x: list[float] = []
+            customdata: list[tuple[object, ...]] = []
+            for e in events:
+                slot_label, block_id = slot_keys[e.slot]
+                dt = e.duration_ms
+                y.append(slot_label)
+                base.append(to_datetime(e.t_ms))
+                x.append(dt)
+                customdata.append((self._valgroup_id, e.slot, dt, block_id))
+
+            self._traces.append(
+                _h_bar(
+                    label,
+                    y,
+                    base,
+                    x,
+                    events[0].get_color(),
+                    customdata,
+                    f"valgroup={self._valgroup_id}<br>slot=%{{customdata[1]}}<br>segment={label}<br>start=%{{base|%H:%M:%S.%f}}<br>dt=%{{customdata[2]:.3f}}ms<br>block_id=%{{customdata[3]}}<extra></extra>",
                 )
             )
 
     def _add_markers(self, markers: list[EventData]) -> None:
-        markers_by_label: dict[str, list[EventData]] = {}
-        for m in markers:
-            markers_by_label.setdefault(m.label, []).append(m)
+        markers_by_label = DataFilter.group_events_by_label(markers)
+        slot_keys = self._slot_keys
 
-        for label in sorted(markers_by_label.keys()):
+        for label in sorted(markers_by_label):
             events = markers_by_label[label]
-            _ = self._fig.add_trace(  # pyright: ignore[reportUnknownMemberType]
-                go.Scatter(
-                    x=[to_datetime(e.t_ms) for e in events],
-                    y=[str(e.slot) for e in events],
+            x: list[datetime] = []
+            y: list[str] = []
+            symbol_by_kind: dict[str, str] = {}
+            customdata: list[tuple[object, ...]] = []
+            for e in events:
+                slot_label, block_id = slot_keys[e.slot]
+                x.append(to_datetime(e.t_ms))
+                y.append(slot_label)
+                if e.kind not in symbol_by_kind:
+                    symbol_by_kind[e.kind] = e.get_symbol()
+                customdata.append((self._valgroup_id, e.slot, block_id))
+
+            # The symbol depends only on the kind, which is almost always
+            # the same for every event of a label: send a scalar then.
+            symbol: str | list[str] = (
+                events[0].get_symbol()
+                if len(symbol_by_kind) == 1
+                else [symbol_by_kind[e.kind] for e in events]
+            )
+
+            self._traces.append(
+                dict(
+                    type="scattergl",
+                    x=x,
+                    y=y,
                     mode="markers",
                     marker=dict(
                         # size=11,
-                        symbol=[e.get_symbol() for e in events],
+                        symbol=symbol,
                         color=events[0].get_color(),
                     ),
                     name=label,
                     legendgroup=f"m:{label}",
-                    customdata=[
-                        [
-                            self._valgroup_id,
-                            e.slot,
-                            to_datetime(e.t_ms).strftime("%H:%M:%S.%f"),
-                            self._slot_dict[e.slot].block_id(),
-                        ]
-                        for e in events
-                    ],
-                    hovertemplate=f"valgroup={self._valgroup_id}<br>slot=%{{customdata[1]}}<br>marker={label}<br>t=%{{customdata[2]}}<br>block_id=%{{customdata[3]}}<extra></extra>",
+                    customdata=customdata,
+                    hovertemplate=f"valgroup={self._valgroup_id}<br>slot=%{{customdata[1]}}<br>marker={label}<br>t=%{{x|%H:%M:%S.%f}}<br>block_id=%{{customdata[2]}}<extra></extra>",
                 )
             )
 
-    def _configure_layout(self, slot_from: int, slot_to: int) -> None:
-        _ = self._fig.update_layout(  # pyright: ignore[reportUnknownMemberType]
+    def _configure_layout(self, fig: go.Figure, slot_from: int, slot_to: int) -> None:
+        _ = fig.update_layout(  # pyright: ignore[reportUnknownMemberType]
             title=dict(
                 text=f"Summary — valgroup ({self._valgroup_id}) · slots from {slot_from} to {slot_to}",
                 xanchor="center",
@@ -180,7 +286,8 @@ class DetailFigureBuilder:
         self._valgroup_id: str = valgroup_id
         self._slot: SlotData = slot
         self._time_mode: str = time_mode
-        self._fig = go.Figure()
+        self._traces: list[Trace] = []
+        self._shapes: list[dict[str, object]] = []
 
     def build(
         self,
@@ -188,110 +295,133 @@ class DetailFigureBuilder:
         markers: list[EventData],
     ) -> go.Figure:
         self._add_baseline_markers(markers)
-        self._add_validator_events(events)
-        self._configure_layout(events)
-        return self._fig
+        validators = self._add_validator_events(events)
+        fig = go.Figure(data=self._traces, _validate=False)
+        self._configure_layout(fig, validators)
+        return fig
 
     def _add_baseline_markers(self, markers: list[EventData]) -> None:
-        for m in markers:
-            x = (
-                to_datetime(m.t_ms)
-                if self._time_mode == "abs"
-                else to_relative(m.t_ms, self._slot.slot_start_est_ms)
+        abs_time = self._time_mode == "abs"
+        slot_start_ms = self._slot.slot_start_est_ms
+        hovertemplate = (
+            "slot: %{customdata[0]}<br>"
+            + (
+                "t=%{customdata[1]|%H:%M:%S.%f}<br>"
+                if abs_time
+                else "t=%{customdata[1]}ms<br>"
             )
+            + "<extra></extra>"
+        )
 
-            _ = self._fig.add_vline(x=x, line_width=1, line_dash="dot")  # pyright: ignore[reportUnknownMemberType]
-            _ = self._fig.add_trace(  # pyright: ignore[reportUnknownMemberType]
-                go.Scatter(
-                    x=[x],
-                    y=["__slot__"],
+        # One trace per label rather than per marker; every marker still
+        # gets its own vline, emitted as the same shape fig.add_vline()
+        # would add and applied in the single layout update.
+        for label, label_markers in DataFilter.group_events_by_label(markers).items():
+            xs: list[datetime | float] = []
+            for m in label_markers:
+                x = (
+                    to_datetime(m.t_ms)
+                    if abs_time
+                    else to_relative(m.t_ms, slot_start_ms)
+                )
+                xs.append(x)
+                self._shapes.append(
+                    dict(
+                        type="line",
+                        x0=x,
+                        x1=x,
+                        xref="x",
+                        y0=0,
+                        y1=1,
+                        yref="y domain",
+                        line=dict(width=1, dash="dot"),
+                    )
+                )
+
+            first = label_markers[0]
+            self._traces.append(
+                dict(
+                    type="scatter",
+                    x=xs,
+                    y=["__slot__"] * len(xs),
                     mode="markers",
                     marker=dict(
                         size=10,
-                        symbol=m.get_symbol(),
-                        color=m.get_color(),
+                        symbol=first.get_symbol(),
+                        color=first.get_color(),
                     ),
-                    name=m.label,
-                    legendgroup=f"slot:{m.label}",
+                    name=label,
+                    legendgroup=f"slot:{label}",
                     showlegend=True,
-                    customdata=[[m.label, x]],
-                    hovertemplate="slot: %{customdata[0]}<br>"
-                    + (
-                        "t=%{customdata[1]|%H:%M:%S.%f}<br>"
-                        if self._time_mode == "abs"
-                        else "t=%{customdata[1]}ms<br>"
-                    )
-                    + "<extra></extra>",
+                    customdata=[(label, x) for x in xs],
+                    hovertemplate=hovertemplate,
                 )
             )
 
-    def _add_validator_events(self, events: list[EventData]) -> None:
-        events_by_label = DataFilter.group_events_by_label(events)
-
-        for label in sorted(events_by_label.keys()):
-            if label not in (
-                "block_validation",
-                "finalization",
-                "collation",
-                "skip_observed",
-                "candidate_received",
-            ):
+    def _add_validator_events(self, events: list[EventData]) -> set[int | str]:
+        # The layout needs every validator of the slot, including ones whose
+        # events are not drawn; collect them in the same pass.
+        validators: set[int | str] = set()
+        events_by_label: defaultdict[str, list[EventData]] = defaultdict(list)
+        for e in events:
+            if e.validator is not None:
+                validators.add(e.validator)
+            if e.label in DETAIL_EVENT_LABELS:
+                events_by_label[e.label].append(e)
+        abs_time = self._time_mode == "abs"
+        slot_start_ms = self._slot.slot_start_est_ms
+
+        for label in DETAIL_EVENT_ORDER:
+            label_events = events_by_label.get(label)
+            if not label_events:
                 continue
-            label_events = events_by_label[label]
-
-            if self._time_mode == "abs":
-                base = [to_datetime(e.t_ms) for e in label_events]
-                x = [e.t1_ms - e.t_ms if e.t1_ms else 0 for e in label_events]
-            else:
-                base = [
-                    to_relative(e.t_ms, self._slot.slot_start_est_ms)
-                    for e in label_events
-                ]
-                x = [e.t1_ms - e.t_ms if e.t1_ms else 0 for e in label_events]
-
-            kwargs = dict(
-                name=label,
-                legendgroup=f"ev:{label}",
-                customdata=[
-                    [
-                        self._valgroup_id,
-                        self._slot.slot,
-                        e.validator,
-                        label,
-                        e.kind,
-                        e.t1_ms - e.t_ms if e.t1_ms else 0,
-                        b,
-                    ]
-                    for e, b in zip(label_events, base)
-                ],
-            )
 
-            if label not in ("skip_observed", "candidate_received"):
-                _ = self._fig.add_trace(  # pyright: ignore[reportUnknownMemberType]
-                    go.Bar(
-                        orientation="h",
-                        base=base,
-                        x=x,
-                        y=[e.validator for e in label_events],
-                        marker=dict(color=label_events[0].get_color()),
-                        hovertemplate=(
-                            f"valgroup={self._valgroup_id}<br>slot={self._slot.slot}<br>"
-                            + f"validator=%{{customdata[2]}}<br>event={label} (kind=%{{customdata[4]}})<br>"
-                            + (
-                                "start=%{base|%H:%M:%S.%f}<br>"
-                                if self._time_mode == "abs"
-                                else "start=%{base}ms<br>"
-                            )
-                            + "dt=%{customdata[5]:.3f}ms<extra></extra>"
-                        ),
-                        **kwargs,
+            base: list[datetime | float] = []
+            x: list[float] = []
+            y: list[int | str | None] = []
+            customdata: list[tuple[object, ...]] = []
+            for e in label_events:
+                b = (
+                    to_datetime(e.t_ms)
+                    if abs_time
+                    else to_relative(e.t_ms, slot_start_ms)
+                )
+                dt = e.duration_ms
+                base.append(b)
+                x.append(dt)
+                y.append(e.validator)
+                # valgroup, slot and label are constant per trace and live
+                # in the hovertemplate instead.
+                customdata.append((e.validator, e.kind, dt, b))
+
+            if label not in DETAIL_MARKER_LABELS:
+                bar = _h_bar(
+                    label,
+                    y,
+                    base,
+                    x,
+                    label_events[0].get_color(),
+                    customdata,
+                    f"valgroup={self._valgroup_id}<br>slot={self._slot.slot}<br>"
+                    + f"validator=%{{customdata[0]}}<br>event={label} (kind=%{{customdata[1]}})<br>"
+                    + (
+                        "start=%{base|%H:%M:%S.%f}<br>"
+                        if self._time_mode == "abs"
+                        else "start=%{base}ms<br>"
                     )
+                    + "dt=%{customdata[2]:.3f}ms<extra></extra>",
+                    legendgroup=f"ev:{label}",
                 )
+                self._traces.append(bar)
             else:
-                _ = self._fig.add_trace(  # pyright: ignore[reportUnknownMemberType]
-                    go.Scatter(
+                self._traces.append(
+                    dict(
+                        type="scattergl",
+                        name=label,
+                        legendgroup=f"ev:{label}",
+                        customdata=customdata,
                         x=base,
-                        y=[e.validator for e in label_events],
+                        y=y,
                         mode="markers",
                         marker=dict(
                             size=10,
@@ -300,20 +430,22 @@ class DetailFigureBuilder:
                         ),
                         hovertemplate=(
                             f"valgroup={self._valgroup_id}<br>slot={self._slot.slot}<br>"
-                            + f"validator=%{{customdata[2]}}<br>event={label} (kind=%{{customdata[4]}})<br>"
+                            + f"validator=%{{customdata[0]}}<br>event={label} (kind=%{{customdata[1]}})<br>"
                             + (
-                                "t=%{customdata[6]|%H:%M:%S.%f}<br><extra></extra>"
+                                "t=%{customdata[3]|%H:%M:%S.%f}<br><extra></extra>"
                                 if self._time_mode == "abs"
                                 else "t=%{x}ms<br><extra></extra>"
                             )
                         ),
-                        **kwargs,
                     )
                 )
 
+        return validators
+
     def _configure_layout(
         self,
-        events: list[EventData],
+        fig: go.Figure,
+        validators: set[int | str],
     ) -> None:
         title = f"Detail — valgroup ({self._valgroup_id}) slot {self._slot.slot}"
         if self._slot.is_empty:
@@ -323,12 +455,11 @@ class DetailFigureBuilder:
         if self._slot.block_id_ext:
             title += f"<br>block={self._slot.block_id_ext}"
 
-        validators = sorted({e.validator for e in events if e.validator is not None})
         x_title = (
             "t - slot_start_est (ms)" if self._time_mode == "rel" else "Time (UTC)"
         )
 
-        _ = self._fig.update_layout(  # pyright: ignore[reportUnknownMemberType]
+        _ = fig.update_layout(  # pyright: ignore[reportUnknownMemberType]
             title=dict(
                 text=title,
                 xanchor="center",
@@ -348,16 +479,28 @@ class DetailFigureBuilder:
                 title="Validator",
                 type="category",
                 categoryorder="array",
-                categoryarray=["__slot__"] + validators,
+                categoryarray=["__slot__", *sorted(validators)],
             ),
             margin=dict(l=130, r=20, t=60, b=55),
             dragmode="pan",
+            shapes=self._shapes,
         )
 
 
+@final
 class FigureBuilder:
     def __init__(self, data: ConsensusData):
         self._filter: DataFilter = DataFilter(data)
+        # The data is fixed once parsed, so a figure depends only on the
+        # arguments; Dash re-runs the callbacks on every interaction (slot
+        # navigation, toggling back and forth), so keep recent figures.
+        # Returned figures are shared and must not be mutated by callers.
+        self._summary_cache: Callable[[str, int, int, bool], go.Figure] = lru_cache(
+            maxsize=32
+        )(self._build_summary)
+        self._detail_cache: Callable[[str, int, str], go.Figure] = lru_cache(
+            maxsize=128
+        )(self._build_detail)
 
     def build_summary(
         self,
@@ -366,27 +509,43 @@ class FigureBuilder:
         slot_to: int,
         show_empty: bool,
     ) -> go.Figure:
-        slots = self._filter.filter_slots(valgroup_id, slot_from, slot_to, show_empty)
-        slot_set = {s.slot for s in slots}
-        slot_dict = {s.slot: s for s in slots}
-
-        segments = self._filter.filter_events(
-            valgroup_id=valgroup_id,
-            slots=slot_set,
-            kinds={"phase"},
-        )
+        return self._summary_cache(valgroup_id, slot_from, slot_to, show_empty)
 
-        markers = self._filter.filter_events(
-            valgroup_id=valgroup_id,
-            slots=slot_set,
-            has_validator=False,
-            kinds={"estimate", "observed"},
-        )
+    def build_detail(
+        self,
+        valgroup_id: str,
+        slot: int,
+        time_mode: str,
+    ) -> go.Figure:
+        return self._detail_cache(valgroup_id, slot, time_mode)
 
+    def _build_summary(
+        self,
+        valgroup_id: str,
+        slot_from: int,
+        slot_to: int,
+        show_empty: bool,
+    ) -> go.Figure:
+        slots = self._filter.filter_slots(valgroup_id, slot_from, slot_to, show_empty)
+        slot_dict = {s.slot: s for s in slots}
         builder = SummaryFigureBuilder(valgroup_id, slot_dict)
+        if not slot_dict:
+            return builder.build([], [], slot_from, slot_to)
+
+        # One pass over the range's events splits them into both inputs.
+        segments: list[EventData] = []
+        markers: list[EventData] = []
+        for e in self._filter.filter_events(
+            valgroup_id=valgroup_id, slots=set(slot_dict)
+        ):
+            if e.kind == "phase":
+                segments.append(e)
+            elif e.validator is None and e.kind in ("estimate", "observed"):
+                markers.append(e)
+
         return builder.build(segments, markers, slot_from, slot_to)
 
-    def build_detail(
+    def _build_detail(
         self,
         valgroup_id: str,
         slot: int,
@@ -396,23 +555,19 @@ class FigureBuilder:
         if not slot_data:
             return go.Figure().update_layout(title="No slot selected")  # pyright: ignore[reportUnknownMemberType]
 
-        events = self._filter.filter_events(
-            valgroup_id=valgroup_id,
-            slot=slot,
-            has_validator=True,
-        )
+        # One pass over the slot's events splits them into both inputs.
+        events: list[EventData] = []
+        markers: list[EventData] = []
+        for e in self._filter.filter_events(valgroup_id=valgroup_id, slot=slot):
+            if e.validator is not None:
+                events.append(e)
+            elif e.kind in ("observed", "reached"):
+                markers.append(e)
 
         if not events:
             return go.Figure().update_layout(  # pyright: ignore[reportUnknownMemberType]
                 title=f"{valgroup_id} slot {slot}: no events"
             )
 
-        markers = self._filter.filter_events(
-            valgroup_id=valgroup_id,
-            slot=slot,
-            has_validator=False,
-            kinds={"observed", "reached"},
-        )
-
         builder = DetailFigureBuilder(valgroup_id, slot_data, time_mode)
         return builder.build(events, markers)